@@ -0,0 +1,289 @@
+# SYS-350 pyvmomi automation - asyncio variant over the vSphere REST API
+import asyncio
+from typing import Any
+
+import aiohttp
+
+from sysvm import _read_config_cached
+
+# Requires the optional "async" dependency group (aiohttp); the SOAP-based VConn
+# in sysvm/__init__.py remains the default and has no aiohttp requirement.
+
+
+class AsyncVConn:
+    """Asyncio vCenter client backed by the vSphere Automation REST API.
+
+    The SOAP-based VConn blocks the caller on every round-trip; this client
+    drives the REST endpoints through a single shared aiohttp session, so many
+    in-flight waits (inventory reads, batched power operations) interleave on
+    one event loop instead of stacking up serially or spawning threads.
+
+    Unlike VConn, VMs and networks are represented as their REST summaries
+    (dicts with "vm"/"network" identifiers and "name" keys) rather than
+    pyVmomi managed objects.
+    """
+
+    config_file: str = "config.ini"
+    hostname: str
+    username: str
+    password: str
+
+    # HTTP statuses vCenter returns when the client outruns its request limits
+    _RETRY_STATUSES = frozenset({429, 503})
+    _MAX_RETRIES = 4
+
+    def __init__(
+        self,
+        config_file: str = "",
+        max_concurrency: int = 128,
+        hostname: str = "",
+        username: str = "",
+    ) -> None:
+        """Instantiate async vCenter connection object.
+
+        Args:
+            config_file (optional): If supplied, overrides default config file location of "config.ini".
+            max_concurrency (optional): Upper bound on in-flight API requests. vCenter
+                caps concurrent vAPI requests (~550 on current releases), so large
+                fan-outs must throttle well below that; tune down for small vCenters.
+                Defaults to 128.
+            hostname (optional): Target vCenter; given together with username, the
+                config file is not consulted (used for multi-vCenter setups).
+            username (optional): Username for the target vCenter, see hostname.
+        """
+        if config_file:
+            self.config_file = config_file
+        self._session: aiohttp.ClientSession | None = None
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        if hostname and username:
+            self.hostname = hostname
+            self.username = username
+        else:
+            self.read_config()
+
+    def read_config(self) -> None:
+        """Read user-supplied config from file."""
+        try:
+            config = _read_config_cached(self.config_file)
+            self.hostname = config["vcenter"]["hostname"]
+            self.username = config["vcenter"]["username"]
+        except KeyError as e:
+            print(f"[!] Failed to parse config file: {self.config_file}")
+            print(e)
+
+    async def connect(self, password: str) -> None:
+        """Create an API session on the vCenter server.
+
+        Args:
+            password(str): Password for use with config file username.
+        """
+        self.password = password
+        # Lab vCenter uses a self-signed certificate, skip verification (as in VConn)
+        connector = aiohttp.TCPConnector(ssl=False)
+        self._session = aiohttp.ClientSession(
+            base_url=f"https://{self.hostname}",
+            connector=connector,
+            raise_for_status=True,
+        )
+        async with self._session.post(
+            "/api/session",
+            auth=aiohttp.BasicAuth(self.username, self.password),
+        ) as response:
+            token = await response.json()
+        # All subsequent requests reuse the session token and pooled connections
+        self._session.headers["vmware-api-session-id"] = token
+
+    async def close(self) -> None:
+        """Tear down the API session and the underlying connection pool."""
+        if self._session is not None:
+            try:
+                await self._session.delete("/api/session")
+            except aiohttp.ClientError:
+                # Session may never have logged in or already be invalid; the
+                # connection pool still needs releasing below
+                pass
+            await self._session.close()
+            self._session = None
+
+    @classmethod
+    async def connect_many(
+        cls,
+        hosts: list[str],
+        username: str,
+        password: str,
+        max_concurrency: int = 128,
+    ) -> list["AsyncVConn"]:
+        """Connect to several vCenter servers concurrently.
+
+        Each login costs around a second of TLS and session handshake; running
+        them under asyncio.gather completes N vCenters in roughly the slowest
+        login instead of the sum.
+
+        Args:
+            hosts: vCenter hostnames to connect to.
+            username: Username shared across the vCenters.
+            password: Password for the given username.
+            max_concurrency (optional): Per-connection request cap, see __init__. Defaults to 128.
+
+        Returns:
+            A list of connected AsyncVConn objects, in hosts order.
+        """
+        vcs = [
+            cls(hostname=host, username=username, max_concurrency=max_concurrency)
+            for host in hosts
+        ]
+        results = await asyncio.gather(
+            *(vc.connect(password) for vc in vcs), return_exceptions=True
+        )
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if errors:
+            # Don't leak the sessions that did come up
+            await asyncio.gather(
+                *(vc.close() for vc in vcs), return_exceptions=True
+            )
+            raise errors[0]
+        return vcs
+
+    async def __aenter__(self) -> "AsyncVConn":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Active aiohttp session, available after connect()."""
+        if self._session is None:
+            raise RuntimeError("Not connected, call connect() first")
+        return self._session
+
+    async def _request(
+        self, method: str, path: str, params: dict | None = None, json: Any = None
+    ) -> Any:
+        """Issue one API request under the concurrency limit and return any JSON body.
+
+        All requests pass through the shared semaphore so a large fan-out can't
+        exceed vCenter's concurrent-request ceiling, and throttling responses
+        (429/503) are retried with exponential backoff.
+        """
+        delay = 1.0
+        for attempt in range(self._MAX_RETRIES):
+            async with self._semaphore:
+                try:
+                    async with self.session.request(
+                        method, path, params=params, json=json
+                    ) as response:
+                        if response.content_type == "application/json":
+                            return await response.json()
+                        return None
+                except aiohttp.ClientResponseError as e:
+                    if e.status not in self._RETRY_STATUSES or attempt == self._MAX_RETRIES - 1:
+                        raise
+            # Back off outside the semaphore so waiting doesn't hold a slot
+            await asyncio.sleep(delay)
+            delay *= 2
+
+    async def _get_json(self, path: str, **params: str) -> Any:
+        """Issue a GET against the REST API and return the decoded JSON body."""
+        return await self._request("GET", path, params=params or None)
+
+    async def get_vms(self, search: str = "", exact: bool = False) -> list[dict]:
+        """Get a list of all VMs on the connected server.
+
+        Args:
+            search (optional): If provided, only return VMs with names matching this string. Defaults to "".
+            exact (optional): Only return VMs with name exactly matching the search string. Defaults to False.
+
+        Returns:
+            A list of VM summary dicts ("vm", "name", "power_state", ...).
+        """
+        if search and exact:
+            # The REST endpoint can filter exact names server-side
+            vms = await self._get_json("/api/vcenter/vm", names=search)
+        else:
+            vms = await self._get_json("/api/vcenter/vm")
+            if search:
+                vms = [vm for vm in vms if search in vm["name"]]
+        return vms
+
+    async def get_vmnets(self) -> list[dict]:
+        """Retrieve list of available virtual networks in the environment."""
+        return await self._get_json("/api/vcenter/network")
+
+    async def list_info(self) -> dict:
+        """Retrieve current session info for the connection."""
+        session_info = await self._get_json("/api/session")
+        return {
+            "Username": session_info.get("user", self.username),
+            "vCenter Server": self.hostname,
+        }
+
+    async def vms_power(self, vms: list[dict], power_state: bool) -> None:
+        """Modify VMs power state, dispatching all requests concurrently.
+
+        Args:
+            vms: List of VM summary dicts to change the power state for.
+            power_state: Desired power state. True to Power On, False to Power Off.
+        """
+        await asyncio.gather(*[self._power_one(vm, power_state) for vm in vms])
+
+    async def _power_one(self, vm: dict, power_state: bool) -> None:
+        """Issue a single power action against one VM."""
+        action = "start" if power_state is True else "stop"
+        await self._request("POST", f"/api/vcenter/vm/{vm['vm']}/power", params={"action": action})
+
+    async def vms_snapshot(self, vms: list[dict], name: str) -> None:
+        """Snapshot VMs, dispatching all requests concurrently.
+
+        Requires the VM snapshot REST endpoints (vSphere 8.0U1+).
+
+        Args:
+            vms: List of VM summary dicts to snapshot.
+            name: Name to be used for the snapshot(s).
+        """
+        await asyncio.gather(*[self._snapshot_one(vm, name) for vm in vms])
+
+    async def _snapshot_one(self, vm: dict, name: str) -> None:
+        """Create a snapshot on one VM."""
+        await self._request(
+            "POST",
+            f"/api/vcenter/vm/{vm['vm']}/snapshots",
+            json={"name": name, "description": "Created with sysvm"},
+        )
+
+    async def vms_restore_snapshot(self, vms: list[dict]) -> None:
+        """Restore VMs to latest snapshot, dispatching all requests concurrently.
+
+        Requires the VM snapshot REST endpoints (vSphere 8.0U1+).
+
+        Args:
+            vms: List of VM summary dicts to restore latest snapshot on.
+        """
+        await asyncio.gather(*[self._restore_one(vm) for vm in vms])
+
+    async def _restore_one(self, vm: dict) -> None:
+        """Revert one VM to its most recent snapshot."""
+        snapshots = await self._get_json(f"/api/vcenter/vm/{vm['vm']}/snapshots")
+        if not snapshots:
+            return
+        latest = snapshots[-1]["snapshot"]
+        await self._request(
+            "POST",
+            f"/api/vcenter/vm/{vm['vm']}/snapshots/{latest}",
+            params={"action": "revert"},
+        )
+
+    async def vms_destroy(self, vms: list[dict]) -> None:
+        """Delete VMs from disk, dispatching all requests concurrently.
+
+        Args:
+            vms: List of VM summary dicts to delete from disk.
+        """
+        await asyncio.gather(*[self._destroy_one(vm) for vm in vms])
+
+    async def _destroy_one(self, vm: dict) -> None:
+        """Power off (if needed) and delete one VM; VMs proceed independently."""
+        power = await self._get_json(f"/api/vcenter/vm/{vm['vm']}/power")
+        if power.get("state") != "POWERED_OFF":
+            await self._power_one(vm, False)
+        await self._request("DELETE", f"/api/vcenter/vm/{vm['vm']}")
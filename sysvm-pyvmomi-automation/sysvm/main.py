@@ -1,22 +1,58 @@
 """CLI application for SYS-350 pyvmomi automation."""
+from __future__ import annotations
+
 import enum
+import functools
+import re
 import sys
 from abc import abstractmethod
 from datetime import datetime
+from datetime import timezone
 from textwrap import dedent
+from typing import TYPE_CHECKING
 
-from pyVmomi import vim
-from rich import print
 from rich import prompt
 from rich.console import Console
 from rich.panel import Panel
 from rich.pretty import pprint
+from rich.progress import Progress
 from rich.table import Table
+from rich.text import Text
+
+if TYPE_CHECKING:
+    from pyVmomi import vim
 
-from sysvm import VConn
+    from sysvm import VConn
+    from sysvm import VMContext
+
+# Importing pyVmomi walks the full SOAP type hierarchy (hundreds of ms), which
+# dominates CLI startup; it is only imported for type checking here and deferred
+# to main() at runtime so the banner appears immediately. rich stays a top-level
+# import since the banner renders through it before anything else happens.
 
 # pyright: reportInvalidStringEscapeSequence=false
 
+# Shared Console: construction probes terminal capabilities and environment
+# variables, so build it once rather than per call. The highlighter regexes are
+# skipped entirely (output styling is explicit markup) and soft wrapping keeps
+# long VM/network names on one line.
+_CONSOLE = Console(highlight=False, soft_wrap=True)
+
+# Static message prefixes parsed from markup once instead of on every print
+_OK = Text.from_markup("[green]\[+][/green]")
+_INFO = Text.from_markup("\[-]")
+
+# Route the module's print() through the shared Console; call sites keep the
+# same name they used with rich's module-level print, which re-parses markup
+# through a separate global console on each call
+print = _CONSOLE.print
+
+
+@functools.cache
+def _command_choices(cls: type["BaseCommand"]) -> list[str]:
+    """Valid prompt choices for a command enum, built once per class."""
+    return [v.value for v in cls]
+
 
 class BaseCommand(enum.Enum):
     @staticmethod
@@ -29,10 +65,13 @@ class BaseCommand(enum.Enum):
     def get_command(cls):
         """Read and parse user commands."""
         while True:
+            # With case_sensitive=False rich validates, strips, and returns the
+            # canonical (lowercase) choice, so no per-input .lower().strip() here
             cmd = prompt.Prompt.ask(
                 "\n[blue]\[?][/blue] Enter your command",
                 default="?",
-                choices=[v.value for v in cls],
+                choices=_command_choices(cls),
+                case_sensitive=False,
             )
             if cmd == "?":
                 print("\[-] Available commands:")
@@ -42,9 +81,9 @@ class BaseCommand(enum.Enum):
                 sys.exit()
             else:
                 try:
-                    return cls(cmd.lower().strip())
+                    return cls(cmd)
                 except ValueError:
-                    print(f"[red]\[!] {cmd.strip()} is not a valid command![/red]")
+                    print(f"[red]\[!] {cmd} is not a valid command![/red]")
 
 
 class Command(BaseCommand):
@@ -62,7 +101,10 @@ class Command(BaseCommand):
                 search_vms(vc)
 
     @staticmethod
+    @functools.cache
     def help_text():
+        # Cached: get_command re-renders this on every "?" prompt, and dedent
+        # rescans the whole literal each call
         return dedent(
             """\
             \[-] [bold]l[/bold]: [italic]List vCenter connection info[/italic]
@@ -87,50 +129,98 @@ class VMCommand(BaseCommand):
 
     def do_command(self, vc: VConn, vms: list[vim.VirtualMachine]):
         """Perform operations on given VM(s)."""
+        from sysvm import VMContext
+
+        # Shared property cache for the selected set: consecutive commands reuse
+        # each batched fetch instead of re-querying vCenter per command
+        ctx = VMContext(vc, vms)
+        command = self
+        # Iterate instead of tail-recursing into do_command after each operation, so
+        # arbitrarily long sessions keep a constant stack depth
+        while True:
+            command._dispatch(vc, vms, ctx)
+            # Allow for multiple subsequent operations on same VM set, unless set was deleted
+            if command == VMCommand.DELETE_FROM_DISK:
+                return
+            command = VMCommand.get_command()
+
+    def _dispatch(self, vc: VConn, vms: list[vim.VirtualMachine], ctx: VMContext):
+        """Perform one operation on given VM(s)."""
         match self:
             case VMCommand.POWER_ON:
                 if prompt.Confirm.ask("[blue]\[?][/blue] Really power on?"):
                     vc.vms_power(vms, True)
+                    ctx.invalidate("power", "info")
                     print("[green]\[+][/green] Powered on.")
             case VMCommand.POWER_OFF:
                 if prompt.Confirm.ask("[blue]\[?][/blue] Really power off?"):
                     vc.vms_power(vms, False)
+                    ctx.invalidate("power", "info")
                     print("[green]\[+][/green] Powered off.")
             case VMCommand.SNAPSHOT:
-                c = Console()
-                # Check if any VMs aren't powered off
-                if any(vm.runtime.powerState != "poweredOff" for vm in vms):
+                c = _CONSOLE
+                # Check if any VMs aren't powered off: one cached batch read of
+                # runtime.powerState instead of a round-trip per VM
+                states = ctx.get("power")
+                powered_on = [
+                    vm
+                    for vm, props in states.items()
+                    if props.get("runtime.powerState") != "poweredOff"
+                ]
+                if powered_on:
                     if not prompt.Confirm.ask(
                         "[blue]\[?][/blue] Not all VMs are powered off. Continuing will power off selected VMs."
                     ):
-                        # Exit to command selection
+                        # Exit to command selection (the do_command loop re-prompts)
                         c.print("\[-] Cancelling snapshot creation.")
-                        vm_command = VMCommand.get_command()
-                        vm_command.do_command(vc, vms)
-                    # Power off VMs
-                    vc.vms_power(vms, False)
+                        return
+                    # Power off just the VMs that are still on
+                    vc.vms_power(powered_on, False)
+                    ctx.invalidate("power", "info")
                     c.print("[green]\[+][/green] Powered off.")
-                # Create snapshot
+                # Create snapshot. The default timestamp is rendered only when the
+                # user accepts it (empty input), and at accept time rather than
+                # prompt-construction time, so the name reflects when the snapshot
+                # was actually requested; UTC avoids the local-timezone lookup
                 name = prompt.Prompt.ask(
                     "Name for the snapshot, defaults to ISO8601 date",
-                    default=datetime.now().replace(microsecond=0).isoformat(),
-                    show_default=True,
+                    default="",
+                    show_default=False,
                 )
-                vc.vms_snapshot(vms, name)
+                if not name:
+                    name = (
+                        datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+                    )
+                # Tick a progress bar as each VM's snapshot task settles, so wide
+                # fan-outs show movement instead of appearing hung until the
+                # slowest VM finishes
+                with Progress(console=c, transient=True) as progress:
+                    bar = progress.add_task("Creating snapshots...", total=len(vms))
+                    vc.vms_snapshot(
+                        vms, name, on_complete=lambda _task: progress.advance(bar)
+                    )
                 c.print(
                     f"[green]\[+][/green] Snapshot '{name}' created on {len(vms)} VMs.",
                     highlight=False,
                 )
             case VMCommand.RESTORE_LATEST:
                 vc.vms_restore_snapshot(vms)
+                # Reverting can change power state, guest IP, and hardware
+                ctx.invalidate()
                 print("[green]\[+][/green] Restored latest snapshot.")
             case VMCommand.CHANGE_NETWORK:
-                # Get available networks
-                vmnets = [net.name for net in vc.get_vmnets()]
+                # Get available networks (cached name list, no per-network round-trips)
+                vmnets = vc.get_vmnet_names()
+                # NICs for the whole selected set come from the shared context cache
+                # (one batched call on first use) before the interactive per-VM loop
+                nics_by_vm = ctx.nics()
+                # Names resolved once from the inventory cache, not per print below
+                names = vc.vms_get_names(vms)
                 for vm in vms:
-                    print(f"\[-] Changing network adapter for {vm.name}")
+                    # Pre-parsed prefix Texts: no markup parse per loop iteration
+                    print(_INFO, f"Changing network adapter for {names[vm]}")
                     # Get desired interface
-                    nics = vc.vm_get_nics(vm)
+                    nics = nics_by_vm.get(vm, [])
                     interface = prompt.Prompt.ask(
                         "Select NIC to change",
                         choices=[nic.deviceInfo.label for nic in nics],
@@ -145,28 +235,32 @@ class VMCommand(BaseCommand):
                     # Change network
                     vc.vm_change_network(vm, interface, dest_network)
                     print(
-                        f"[green]\[+][/green] Changed {vm.name} adapter {interface} to network {dest_network}."
+                        _OK,
+                        f"Changed {names[vm]} adapter {interface} to network {dest_network}.",
                     )
+                ctx.invalidate("nics")
             case VMCommand.DELETE_FROM_DISK:
                 if prompt.Confirm.ask("[blue]\[?][/blue] Really delete?"):
-                    vc.vms_destroy(vms)
+                    with Progress(console=_CONSOLE, transient=True) as progress:
+                        bar = progress.add_task("Deleting VMs...", total=len(vms))
+                        vc.vms_destroy(
+                            vms, on_complete=lambda _task: progress.advance(bar)
+                        )
                     print("[green]\[+][/green] Deleted from disk.")
             case VMCommand.VIEW_INFO:
+                # Batched property fetch, cached across commands on this set
+                infos = ctx.get("info")
                 for vm in vms:
                     print()
-                    _list_vm_info(vm)
+                    _list_vm_info(infos.get(vm, {}))
             case VMCommand.COMMAND:
                 cmd = Command.get_command()
                 cmd.do_command(vc)
             case _:
                 print("[red]\[!][/red] Command not yet implemented!")
 
-        # Allow for multiple subsequent operations on same VM set, unless set was deleted
-        if not self == VMCommand.DELETE_FROM_DISK:
-            vm_command = VMCommand.get_command()
-            vm_command.do_command(vc, vms)
-
     @staticmethod
+    @functools.cache
     def help_text():
         return dedent(
             """\
@@ -181,6 +275,14 @@ class VMCommand(BaseCommand):
         )
 
 
+def _kv_table(title: str = "") -> Table:
+    """Build the standard two-column key/value table used for info displays."""
+    table = Table(title=title, show_header=False)
+    table.add_column("Key")
+    table.add_column("Value")
+    return table
+
+
 def _pprint_dict(d: dict, title: str = "") -> None:
     """Pretty print dictionary key/value pairs by padding the keys to a constant length."""
     # Replaced by 'rich' pretty print functionality, retaining in the event that dependency is removed
@@ -188,13 +290,10 @@ def _pprint_dict(d: dict, title: str = "") -> None:
     # for item in d.items():
     #     print(f"{item[0]:<{key_max}}: {item[1]!s}")
     # pprint(d, expand_all=True)
-    table = Table(title=title, show_header=False)
-    table.add_column("Key")
-    table.add_column("Value")
+    table = _kv_table(title)
     for k, v in d.items():
         table.add_row(k, str(v))
-    console = Console()
-    console.print(table)
+    _CONSOLE.print(table)
 
 
 def list_info(vc: VConn):
@@ -211,28 +310,41 @@ def list_info(vc: VConn):
     _pprint_dict(vc_info, title="vCenter Connection Info")
 
 
-def _list_vm_info(vm: vim.VirtualMachine) -> None:
-    """Internal function to print information for a given VM."""
+def _list_vm_info(info: dict) -> None:
+    """Internal function to print information for a given VM.
+
+    Args:
+        info: Prefetched property dict for one VM, as returned by VConn.vms_get_info.
+    """
     vm_info = {
-        "VM Name": vm.name,
-        "State": vm.runtime.powerState,
-        "CPUs": vm.config.hardware.numCPU,
-        "RAM (GB)": f"{(vm.config.hardware.memoryMB / 1024):0.2}",
-        "IP Address": vm.guest.ipAddress,
+        "VM Name": info.get("name"),
+        "State": info.get("runtime.powerState"),
+        "CPUs": info.get("config.hardware.numCPU"),
+        "RAM (GB)": f"{(info.get('config.hardware.memoryMB') or 0) / 1024:0.2}",
+        "IP Address": info.get("guest.ipAddress"),
     }
-    _pprint_dict(vm_info, title=f"'{vm.name}' VM Info")
+    _pprint_dict(vm_info, title=f"'{info.get('name')}' VM Info")
 
 
 def search_vms(vc: VConn, query: str | None = None):
     """Search vCenter VMs by name."""
     if not query:
         query = prompt.Prompt.ask(
-            "[blue]\[?][/blue] Search query, or <Enter> to list all VMs",
+            "[blue]\[?][/blue] Search query (/pattern/ for regex), or <Enter> to list all VMs",
             default="",
             show_default=False,
         )
+    query = query.strip()
     # This is kept as list[ManagedObject] for later functionality, e.g. returning VMs or performing operations on them
-    vms = vc.get_vms(query.strip() or "", exact=False)
+    if len(query) > 2 and query.startswith("/") and query.endswith("/"):
+        # A /pattern/ query searches VM names by regular expression
+        try:
+            vms = vc.get_vms(regex=query[1:-1])
+        except re.error as e:
+            print(f"[red]\[!] Invalid regex: {e}[/red]")
+            return
+    else:
+        vms = vc.get_vms(query or "", exact=False)
 
     # Check that we got results back
     print(f"[green]\[+][/green] {len(vms)} results returned.")
@@ -243,7 +355,8 @@ def search_vms(vc: VConn, query: str | None = None):
     # Print a list of matched VM names, if a reasonable size
     if len(vms) <= 50:
         print("[green]\[+][/green] Matched VMs: ")
-        pprint([vm.name for vm in vms])
+        # Names come from the inventory cache, not a .name round-trip per VM
+        pprint(list(vc.vms_get_names(vms).values()))
         print()
     else:
         print("\[-] More than 50 VMs, skipping display of names...")
@@ -253,9 +366,25 @@ def search_vms(vc: VConn, query: str | None = None):
         f"[blue]\[?][/blue] List VM details for all {len(vms)} result(s)?",
         default=False,
     ):
+        # One aggregated table for the whole result set: a single Table build and
+        # print instead of a Table per VM, and aligned columns across results
+        table = Table(title=f"VM Info ({len(vms)} result(s))")
+        for column in ("VM Name", "State", "CPUs", "RAM (GB)", "IP Address"):
+            table.add_column(column)
+        # One batched property fetch for the whole result set instead of five
+        # attribute round-trips per VM
+        infos = vc.vms_get_info(vms)
         for vm in vms:
-            print()
-            _list_vm_info(vm)
+            info = infos.get(vm, {})
+            table.add_row(
+                str(info.get("name", "")),
+                str(info.get("runtime.powerState", "")),
+                str(info.get("config.hardware.numCPU", "")),
+                f"{(info.get('config.hardware.memoryMB') or 0) / 1024:0.2}",
+                str(info.get("guest.ipAddress")),
+            )
+        print()
+        _CONSOLE.print(table)
 
     # Optionally perform tasks on VM(s)
     vm_command = VMCommand.get_command()
@@ -270,6 +399,11 @@ def main():
             expand=False,
         )
     )
+    # Deferred heavy imports, see the note below the module imports
+    from pyVmomi import vim
+
+    from sysvm import VConn
+
     vc = VConn()
     print("\[-] Connecting to vCenter, enter password below:")
     try: